@@ -12,6 +12,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import numpy as np
 import openmdao.api as om
 
 from fastoad.module_management.constants import ModelDomain
@@ -24,25 +25,37 @@ from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
 class BasicDisc1(om.ExplicitComponent):
     """An OpenMDAO component to encapsulate Disc1 discipline"""
 
+    def initialize(self):
+        self.options.declare(
+            "num_nodes", default=1, types=int, desc="Number of points where y1 is evaluated"
+        )
+
     def setup(self):
-        self.add_input("x", val=2.0)
+        num_nodes = self.options["num_nodes"]
+        self.add_input("x", val=2.0, shape=num_nodes)
         self.add_input("z", val=[5.0, 2.0])
-        self.add_input("y2", val=1.0)
+        self.add_input("y2", val=1.0, shape=num_nodes)
 
-        self.add_output("y1", val=1.0)
+        self.add_output("y1", val=1.0, shape=num_nodes)
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        num_nodes = self.options["num_nodes"]
+        nodes = np.arange(num_nodes)
+        self.declare_partials("y1", "x", rows=nodes, cols=nodes, val=1.0)
+        self.declare_partials("y1", "y2", rows=nodes, cols=nodes, val=-0.2)
+        self.declare_partials("y1", "z")
 
     # pylint: disable=invalid-name
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         Evaluates the equation
         y1 = z1**2 + z2 + x1 - 0.2*y2
+
+        x1, y2 and y1 are vectors of num_nodes elements, so all points are evaluated at once.
         """
-        z1 = inputs["z"][0]
-        z2 = inputs["z"][1]
-        x1 = inputs["x"]
-        y2 = inputs["y2"]
+        z = inputs["z"]
+        outputs["y1"] = z[0] * z[0] + z[1] + inputs["x"] - 0.2 * inputs["y2"]
 
-        outputs["y1"] = z1**2 + z2 + x1 - 0.2 * y2
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        # Same derivatives for all points
+        partials["y1", "z"] = np.tile([2.0 * inputs["z"][0], 1.0], (self.options["num_nodes"], 1))
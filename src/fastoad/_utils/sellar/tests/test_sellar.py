@@ -11,8 +11,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import numpy as np
+import openmdao.api as om
+import pytest
 from numpy.testing import assert_allclose
+from openmdao.utils.assert_utils import assert_check_partials
 
+from fastoad._utils.sellar.disc1 import BasicDisc1
 from fastoad._utils.sellar.sellar_base import BasicSellarModel, BasicSellarProblem
 
 
@@ -22,3 +27,31 @@ def test_sellar():
     problem.setup()
     problem.run_driver()
     assert_allclose(problem["f"], 3.183393951729169)
+
+
+def test_disc1_num_nodes():
+    problem = om.Problem()
+    problem.model.add_subsystem("disc1", BasicDisc1(num_nodes=3), promotes=["*"])
+    problem.setup()
+
+    problem["x"] = [1.0, 2.0, 3.0]
+    problem["z"] = [4.0, 1.5]
+    problem["y2"] = [10.0, 5.0, 0.0]
+    problem.run_model()
+
+    assert_allclose(problem["y1"], [16.5, 18.5, 20.5])
+
+
+@pytest.mark.parametrize("num_nodes", [1, 3])
+def test_disc1_partials(num_nodes):
+    problem = om.Problem()
+    problem.model.add_subsystem("disc1", BasicDisc1(num_nodes=num_nodes), promotes=["*"])
+    problem.setup(force_alloc_complex=True)
+
+    problem["x"] = np.linspace(1.0, 3.0, num_nodes)
+    problem["z"] = [4.0, 1.5]
+    problem["y2"] = np.linspace(10.0, 0.0, num_nodes)
+    problem.run_model()
+
+    data = problem.check_partials(method="cs", out_stream=None)
+    assert_check_partials(data)
@@ -16,13 +16,19 @@ Module for building OpenMDAO problem from configuration file
 
 import json
 import logging
+import os
 import shutil
 import sys
+import weakref
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
 from importlib import import_module
 from os import PathLike
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from types import CodeType
+from typing import Dict, List, Optional, Tuple, Union
 
 import openmdao.api as om
 import tomlkit
@@ -32,14 +38,21 @@ from ruamel.yaml import YAML
 from fastoad._utils.files import as_path, make_parent_dir
 from fastoad._utils.resource_management.contents import PackageReader
 from fastoad.io import IVariableIOFormatter
+from fastoad.module_management._bundle_loader import BundleLoader
 from fastoad.module_management.service_registry import RegisterOpenMDAOSystem, RegisterSubmodel
 from fastoad.openmdao.problem import FASTOADProblem
+from fastoad.openmdao.variables import Variable
 from . import resources
 from .exceptions import (
     FASTConfigurationBadOpenMDAOInstructionError,
     FASTConfigurationBaseKeyBuildingError,
 )
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    tomllib = None
+
 _LOGGER = logging.getLogger(__name__)  # Logger for this module
 
 KEY_FOLDERS = "module_folders"
@@ -59,6 +72,12 @@ KEY_CONSTRAINTS = "constraints"
 KEY_OBJECTIVE = "objective"
 JSON_SCHEMA_NAME = "configuration.json"
 
+# Content of already read configuration files. Keys are resolved file paths.
+_CONFIGURATION_CACHE: Dict[Path, "_CachedConfiguration"] = {}
+
+# Module folders that have already been explored. Keys are resolved folder paths.
+_EXPLORED_FOLDERS: Dict[Path, "_ExploredFolder"] = {}
+
 
 class FASTOADProblemConfigurator:
     """
@@ -164,7 +183,7 @@ class FASTOADProblemConfigurator:
             )
         else:
             self._serializer = _YAMLSerializer()
-        self._serializer.read(self._conf_file_path)
+        cached_configuration = self._read_configuration_file()
 
         # Syntax validation
         with PackageReader(resources).open_text(JSON_SCHEMA_NAME) as json_file:
@@ -194,11 +213,30 @@ class FASTOADProblemConfigurator:
                 _LOGGER.warning('Configuration file: "%s" is not a FAST-OAD key.', key)
 
         # Looking for modules to register
-        for module_folder_path in self._get_module_folder_paths():
+        if cached_configuration.module_folder_paths is None:
+            cached_configuration.module_folder_paths = [
+                module_folder_path.resolve()
+                for module_folder_path in self._get_module_folder_paths()
+            ]
+        framework = None
+        for module_folder_path in cached_configuration.module_folder_paths:
             if not module_folder_path.is_dir():
                 _LOGGER.warning("SKIPPED %s: it does not exist.", module_folder_path)
+                continue
+
+            if framework is None:
+                framework = BundleLoader().framework
+
+            explored_folder = _EXPLORED_FOLDERS.get(module_folder_path)
+            if explored_folder is not None and explored_folder.is_up_to_date(framework):
+                # Bundles are already installed, but variable descriptions may have been
+                # reset since exploration.
+                Variable.read_variable_descriptions(module_folder_path.as_posix())
             else:
                 RegisterOpenMDAOSystem.explore_folder(module_folder_path.as_posix())
+                _EXPLORED_FOLDERS[module_folder_path] = _ExploredFolder(
+                    module_folder_path, weakref.ref(framework)
+                )
 
         # Settings submodels
         RegisterSubmodel.cancel_submodel_deactivations()
@@ -220,6 +258,7 @@ class FASTOADProblemConfigurator:
 
         make_parent_dir(filename)
         self._serializer.write(filename)
+        _CONFIGURATION_CACHE.pop(as_path(filename).resolve(), None)
 
     def write_needed_inputs(
         self,
@@ -362,6 +401,29 @@ class FASTOADProblemConfigurator:
                         original_file_path, new_root_path, local_path / key
                     )
 
+    def _read_configuration_file(self) -> "_CachedConfiguration":
+        """
+        Reads current configuration file using current serializer.
+
+        Data are taken from cache if the file has not been modified since last time it was read.
+        A copy is provided to the serializer, so that the cache is not affected by later
+        modifications of the configuration.
+
+        :return: the cache entry for current configuration file
+        """
+        file_stat = self._conf_file_path.stat()
+        file_stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        cached_configuration = _CONFIGURATION_CACHE.get(self._conf_file_path)
+        if cached_configuration and cached_configuration.file_stamp == file_stamp:
+            self._serializer.data = deepcopy(cached_configuration.data)
+        else:
+            self._serializer.read(self._conf_file_path)
+            cached_configuration = _CachedConfiguration(file_stamp, deepcopy(self._data))
+            _CONFIGURATION_CACHE[self._conf_file_path] = cached_configuration
+
+        return cached_configuration
+
     def _configure_driver(self, prob):
         driver_config = self._data.get(KEY_DRIVER, {})
 
@@ -464,51 +526,80 @@ class FASTOADProblemConfigurator:
         """
         Feeds provided *group*, using definition in provided TOML *table*.
 
+        Sub-groups are processed through a work list instead of recursive calls.
+
         :param group:
         :param table:
         """
         # assert isinstance(table, dict), "table should be a dictionary"
 
-        for key, value in table.items():
-            if isinstance(value, dict):  # value defines a sub-component
-                if KEY_COMPONENT_ID in value:
-                    # It is a non-group component, that should be registered with its ID
-                    options = value.copy()
-                    identifier = options.pop(KEY_COMPONENT_ID)
-
-                    self._make_option_path_values_absolute(options)
-
-                    sub_component = RegisterOpenMDAOSystem.get_system(identifier, options=options)
-                    group.add_subsystem(key, sub_component, promotes=["*"])
-                else:
-                    # It is a Group
-                    sub_component = group.add_subsystem(key, om.Group(), promotes=["*"])
-                    try:
-                        self._parse_problem_table(sub_component, value)
-                    except FASTConfigurationBadOpenMDAOInstructionError as err:
-                        # There has been an error while parsing an attribute.
-                        # Error is relayed with key added for context
-                        raise FASTConfigurationBadOpenMDAOInstructionError(err, key)
-            elif key == KEY_CONNECTION_ID and isinstance(value, list):
-                # a list of dict currently defines only connections
-                for connection_def in value:
-                    group.connect(connection_def["source"], connection_def["target"])
-            else:
-                # value may have to be literally interpreted
-                if key.endswith(("solver", "driver")):
-                    try:
-                        value = self._om_eval(str(value))
-                    except Exception as err:
-                        raise FASTConfigurationBadOpenMDAOInstructionError(err, key, value)
-
-                # value is an option or an attribute
-                try:
-                    if key in group.options:
-                        group.options[key] = value
+        # Items are (group, table that defines it, keys from provided group to this table)
+        pending_tables = [(group, table, [])]
+        while pending_tables:
+            current_group, current_table, parent_keys = pending_tables.pop()
+            sub_tables = []
+            try:
+                for key, value in current_table.items():
+                    if isinstance(value, dict):  # value defines a sub-component
+                        if KEY_COMPONENT_ID in value:
+                            # It is a non-group component, that should be registered with its ID
+                            options = value.copy()
+                            identifier = options.pop(KEY_COMPONENT_ID)
+
+                            self._make_option_path_values_absolute(options)
+
+                            sub_component = RegisterOpenMDAOSystem.get_system(
+                                identifier, options=options
+                            )
+                            current_group.add_subsystem(key, sub_component, promotes=["*"])
+                        else:
+                            # It is a Group
+                            sub_component = current_group.add_subsystem(
+                                key, om.Group(), promotes=["*"]
+                            )
+                            sub_tables.append((sub_component, value, parent_keys + [key]))
+                    elif key == KEY_CONNECTION_ID and isinstance(value, list):
+                        # a list of dict currently defines only connections
+                        for connection_def in value:
+                            current_group.connect(
+                                connection_def["source"], connection_def["target"]
+                            )
                     else:
-                        setattr(group, key, value)
-                except Exception as err:
-                    raise FASTConfigurationBadOpenMDAOInstructionError(err, key, value)
+                        self._set_group_attribute(current_group, key, value)
+            except FASTConfigurationBadOpenMDAOInstructionError as err:
+                # There has been an error while parsing an attribute.
+                # Error is relayed with keys of parent groups added for context
+                for parent_key in reversed(parent_keys):
+                    err = FASTConfigurationBadOpenMDAOInstructionError(err, parent_key)
+                raise err
+
+            # Reversed, so that sub-groups are processed in definition order.
+            pending_tables.extend(reversed(sub_tables))
+
+    def _set_group_attribute(self, group: om.Group, key: str, value):
+        """
+        Sets an option or an attribute of provided *group*.
+
+        :param group:
+        :param key: name of option or attribute
+        :param value: value as read in configuration
+        """
+        # value may have to be literally interpreted. Other values have already
+        # been typed when reading the configuration file.
+        if key.endswith(("solver", "driver")) and isinstance(value, str):
+            try:
+                value = self._om_eval(value)
+            except Exception as err:
+                raise FASTConfigurationBadOpenMDAOInstructionError(err, key, value)
+
+        # value is an option or an attribute
+        try:
+            if key in group.options:
+                group.options[key] = value
+            else:
+                setattr(group, key, value)
+        except Exception as err:
+            raise FASTConfigurationBadOpenMDAOInstructionError(err, key, value)
 
     def _make_option_path_values_absolute(self, options):
         # Process option values that are relative paths
@@ -588,7 +679,8 @@ class FASTOADProblemConfigurator:
         Evaluates strings that assume `import openmdao.api as om` is done.
         Evaluates also imports specified in the imports section of the configuration file (if any).
 
-        eval() is used for that, as safely as possible.
+        eval() is used for that, as safely as possible. Compiled code is cached, so
+        evaluating the same string again does not need to parse it again.
 
         :param string_to_eval:
         :return: result of eval()
@@ -597,7 +689,90 @@ class FASTOADProblemConfigurator:
             raise ValueError(
                 "No double underscore allowed in evaluated string for security reasons"
             )
-        return eval(string_to_eval, {"__builtins__": {}}, {"om": om, **self._imported_classes})
+        return eval(
+            _compile_expression(string_to_eval),
+            {"__builtins__": {}},
+            {"om": om, **self._imported_classes},
+        )
+
+
+@lru_cache(maxsize=None)
+def _compile_expression(expression: str) -> CodeType:
+    """
+    Compiles provided expression for use with eval().
+
+    :param expression:
+    :return: the code object
+    """
+    return compile(expression, "<configuration>", "eval")
+
+
+@dataclass
+class _CachedConfiguration:
+    """
+    Data read from a configuration file, and information derived from them.
+    """
+
+    #: (modification time, size) of file when it was read
+    file_stamp: Tuple[int, int]
+
+    #: the data as read from file
+    data: dict
+
+    #: resolved paths of module folders, set once the data have been validated
+    module_folder_paths: Optional[List[Path]] = None
+
+
+@dataclass
+class _ExploredFolder:
+    """
+    Information about a module folder that has been explored.
+
+    A new exploration is needed if the Pelix framework has been restarted, or if files have
+    been added or removed in the folder tree since exploration.
+    """
+
+    #: resolved path of the folder
+    folder_path: Path
+
+    #: weak reference to the Pelix framework that was running at exploration time
+    framework_ref: weakref.ref
+
+    #: folder tree stamp at exploration time, see :meth:`get_folder_stamp`
+    folder_stamp: Optional[int] = None
+
+    def __post_init__(self):
+        if self.folder_stamp is None:
+            self.folder_stamp = self.get_folder_stamp(self.folder_path)
+
+    def is_up_to_date(self, framework) -> bool:
+        """
+        :param framework: the currently running Pelix framework
+        :return: True if exploring the folder again is not needed
+        """
+        return (
+            self.framework_ref() is framework
+            and self.get_folder_stamp(self.folder_path) == self.folder_stamp
+        )
+
+    @staticmethod
+    def get_folder_stamp(folder_path: Path) -> int:
+        """
+        Latest modification time, in nanoseconds, among the folder and its sub-folders.
+
+        Adding or removing a file modifies its parent folder. __pycache__ folders are ignored,
+        as they are modified by the exploration itself.
+
+        :param folder_path:
+        :return: the stamp
+        """
+        stamp = folder_path.stat().st_mtime_ns
+        for parent_path, folder_names, _ in os.walk(folder_path):
+            if "__pycache__" in folder_names:
+                folder_names.remove("__pycache__")
+            for folder_name in folder_names:
+                stamp = max(stamp, os.stat(os.path.join(parent_path, folder_name)).st_mtime_ns)
+        return stamp
 
 
 class _IDictSerializer(ABC):
@@ -610,6 +785,14 @@ class _IDictSerializer(ABC):
         The data that have been read, or will be written.
         """
 
+    @data.setter
+    @abstractmethod
+    def data(self, data: dict):
+        """
+        Sets data without reading them from a file.
+        :param data:
+        """
+
     @abstractmethod
     def read(self, file_path: Union[str, PathLike]):
         """
@@ -635,9 +818,17 @@ class _TOMLSerializer(_IDictSerializer):
     def data(self):
         return self._data
 
+    @data.setter
+    def data(self, data: dict):
+        self._data = data
+
     def read(self, file_path: Union[str, PathLike]):
-        with open(file_path, "r") as toml_file:
-            self._data = tomlkit.loads(toml_file.read()).value
+        content = as_path(file_path).read_text(encoding="utf-8")
+        # tomllib is much faster than tomlkit, that is kept for writing and older Python versions.
+        if tomllib:
+            self._data = tomllib.loads(content)
+        else:
+            self._data = tomlkit.loads(content).value
 
     def write(self, file_path: Union[str, PathLike]):
         with open(file_path, "w") as file:
@@ -654,10 +845,14 @@ class _YAMLSerializer(_IDictSerializer):
     def data(self):
         return self._data
 
+    @data.setter
+    def data(self, data: dict):
+        self._data = data
+
     def read(self, file_path: Union[str, PathLike]):
         yaml = YAML(typ="safe")
-        with open(file_path) as yaml_file:
-            self._data = yaml.load(yaml_file)
+        # Parsing from memory is faster than letting the parser read the file stream.
+        self._data = yaml.load(as_path(file_path).read_bytes())
 
     def write(self, file_path: Union[str, PathLike]):
         yaml = YAML()
@@ -23,6 +23,7 @@ class RegisteredDisc1(BasicDisc1):
     """An OpenMDAO component to encapsulate Disc1 discipline"""
 
     def initialize(self):
+        super().initialize()
         # These options have no effect and are used for checks
         self.options.declare("dummy_disc1_option", types=dict, default={})
         self.options.declare("dummy_generic_option", types=str, default="")
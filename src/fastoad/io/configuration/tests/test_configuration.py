@@ -33,6 +33,8 @@ from fastoad.io.configuration.configuration import FASTOADProblemConfigurator
 from fastoad.module_management._bundle_loader import BundleLoader
 from fastoad.module_management._plugins import FastoadLoader
 from fastoad.module_management.exceptions import FastBundleLoaderUnknownFactoryNameError
+from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
+from fastoad.openmdao.variables import Variable
 from ..exceptions import (
     FASTConfigurationBadOpenMDAOInstructionError,
 )
@@ -343,6 +345,104 @@ def test_set_optimization_definition(cleanup):
         assert optimization_conf == conf_dict_opt
 
 
+def test_configuration_cache(cleanup):
+    """
+    Checks that reading again a configuration file provides the file content, even if
+    previously read data have been modified.
+    """
+    for extension in ["toml", "yml"]:
+        clear_openmdao_registry()
+        reference_file = DATA_FOLDER_PATH / f"valid_sellar.{extension}"
+        editable_file = RESULTS_FOLDER_PATH / f"cached_valid_sellar.{extension}"
+
+        conf_1 = FASTOADProblemConfigurator(reference_file)
+        original_input_file_path = conf_1.input_file_path
+        conf_1.input_file_path = "other_inputs.xml"
+
+        conf_2 = FASTOADProblemConfigurator(reference_file)
+        assert conf_2.input_file_path == original_input_file_path
+
+        # Saving the configuration must make next reading use the new content.
+        conf_1.save(editable_file)
+        conf_3 = FASTOADProblemConfigurator(editable_file)
+        assert Path(conf_3.input_file_path) == RESULTS_FOLDER_PATH / "other_inputs.xml"
+
+        conf_3.input_file_path = "another_inputs.xml"
+        conf_3.save()
+        conf_4 = FASTOADProblemConfigurator(editable_file)
+        assert Path(conf_4.input_file_path) == RESULTS_FOLDER_PATH / "another_inputs.xml"
+
+
+def test_module_folder_exploration(cleanup, monkeypatch):
+    """
+    Checks that a module folder is explored again only if its content has changed, and that
+    its variable descriptions are read at each loading.
+    """
+    clear_openmdao_registry()
+    work_folder_path = RESULTS_FOLDER_PATH / "module_folder_exploration"
+    # Folder name differs from the original one, to avoid any conflict with already imported
+    # Python modules.
+    module_folder_path = work_folder_path / "exploration_sellar_example"
+    shutil.copytree(
+        DATA_FOLDER_PATH / "conf_sellar_example",
+        module_folder_path,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    (module_folder_path / "variable_descriptions.txt").write_text("y1||Output of discipline 1\n")
+    conf_file_path = work_folder_path / "valid_sellar.yml"
+    conf_file_path.write_text(
+        (DATA_FOLDER_PATH / "valid_sellar.yml")
+        .read_text()
+        .replace("- conf_sellar_example", "- exploration_sellar_example")
+    )
+
+    explored_folders = []
+    explore_folder = RegisterOpenMDAOSystem.explore_folder
+    monkeypatch.setattr(
+        RegisterOpenMDAOSystem,
+        "explore_folder",
+        lambda folder_path: explored_folders.append(folder_path) or explore_folder(folder_path),
+    )
+
+    FASTOADProblemConfigurator(conf_file_path)
+    assert len(explored_folders) == 1
+    assert Variable("y1").description == "Output of discipline 1"
+
+    # Loading again does not explore the folder again, but variable descriptions are
+    # read again.
+    Variable.read_variable_descriptions(work_folder_path, update_existing=False)
+    assert not Variable("y1").description
+    FASTOADProblemConfigurator(conf_file_path)
+    assert len(explored_folders) == 1
+    assert Variable("y1").description == "Output of discipline 1"
+
+    # Adding a model file triggers a new exploration.
+    (module_folder_path / "new_disc1.py").write_text(
+        "from fastoad._utils.sellar.disc1 import BasicDisc1\n"
+        "from fastoad.module_management.service_registry import RegisterOpenMDAOSystem\n"
+        "\n"
+        "\n"
+        '@RegisterOpenMDAOSystem("configuration_test.sellar.new_disc1")\n'
+        "class NewDisc1(BasicDisc1):\n"
+        "    pass\n"
+    )
+    # Ensures folder modification time changes, whatever the file system resolution.
+    folder_stat = module_folder_path.stat()
+    os.utime(
+        module_folder_path, ns=(folder_stat.st_atime_ns, folder_stat.st_mtime_ns + 1_000_000_000)
+    )
+    FASTOADProblemConfigurator(conf_file_path)
+    assert len(explored_folders) == 2
+    assert RegisterOpenMDAOSystem.get_system("configuration_test.sellar.new_disc1")
+
+    # Restarting the framework triggers a new exploration.
+    clear_openmdao_registry()
+    FASTOADProblemConfigurator(conf_file_path)
+    assert len(explored_folders) == 3
+
+    Variable.read_variable_descriptions(work_folder_path, update_existing=False)
+
+
 def test_make_local(cleanup):
     for extension in ["toml", "yml"]:
         reference_file = DATA_FOLDER_PATH / f"valid_sellar.{extension}"
@@ -101,10 +101,12 @@ class FlightSequence(IFlightPart):
                 # it is interesting to complete the previous last one.
                 last_flight_points = self.part_flight_points[-1]
                 last_index = last_flight_points.index[-1]
-                for name in flight_points.columns:
-                    value = last_flight_points.loc[last_index, name]
-                    if not value:
-                        last_flight_points.loc[last_index, name] = flight_points.loc[0, name]
+                last_values = last_flight_points.loc[last_index]
+                missing_names = [name for name in flight_points.columns if not last_values[name]]
+                if missing_names:
+                    last_flight_points.loc[last_index, missing_names] = flight_points.loc[
+                        0, missing_names
+                    ].to_list()
 
                 self.part_flight_points.append(flight_points.iloc[1:])
 
@@ -12,8 +12,11 @@
 #  GNU General Public License for more details.
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Optional
+
+import numpy as np
 from numpy import ndarray
-from scipy.interpolate import interp1d
+from scipy.interpolate import interp1d, make_interp_spline
 from scipy.optimize import fmin
 
 
@@ -39,7 +42,23 @@ class Polar:
         self._definition_CD = cd
 
         # Interpolate cd
-        self._cd_vs_cl = interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")
+        # For finite data, this is the quadratic spline that
+        # interp1d(kind="quadratic", fill_value="extrapolate") would build, but calling it
+        # directly avoids the overhead of interp1d at each evaluation.
+        # Non-finite data are left to interp1d, which handles them without reaching LAPACK.
+        if np.all(np.isfinite(cl)) and np.all(np.isfinite(cd)):
+            sorting_indices = np.argsort(cl, kind="mergesort")
+            self._cd_vs_cl = make_interp_spline(
+                np.asarray(cl)[sorting_indices],
+                np.asarray(cd)[sorting_indices],
+                k=2,
+                check_finite=False,
+            )
+        else:
+            self._cd_vs_cl = interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")
+        # When CD is a quadratic function of CL, which is a common case, evaluating the
+        # polynomial is cheaper than evaluating the spline, and gives the same result.
+        self._cd_polynomial = self._get_quadratic_coefficients(cl, cd)
 
         # CL as a function of AoA
         self._definition_alpha = alpha
@@ -81,7 +100,13 @@ class Polar:
         :return: CD values for each provide CL values
         """
         if cl is None:
-            return self._cd_vs_cl(self._definition_CL)
+            cl = self._definition_CL
+
+        if self._cd_polynomial is not None:
+            c_2, c_1, c_0 = self._cd_polynomial
+            cl = np.asarray(cl)
+            return (c_2 * cl + c_1) * cl + c_0
+
         return self._cd_vs_cl(cl)
 
     def cl(self, alpha):
@@ -95,3 +120,28 @@ class Polar:
             raise ValueError("Polar was instantiated without alpha vector.")
 
         return self._cl_vs_alpha(alpha)
+
+    @staticmethod
+    def _get_quadratic_coefficients(cl: ndarray, cd: ndarray) -> Optional[ndarray]:
+        """
+        Checks if CD is a 2nd-degree polynomial of CL.
+
+        :param cl: CL values
+        :param cd: CD values
+        :return: the polynomial coefficients, highest power first, or None if CD data do not
+                 match a 2nd-degree polynomial
+        """
+        cl = np.asarray(cl, dtype=float)
+        cd = np.asarray(cd, dtype=float)
+        if not (np.all(np.isfinite(cl)) and np.all(np.isfinite(cd))):
+            return None
+        # Less than 3 distinct CL values do not define a 2nd-degree polynomial
+        if len(np.unique(cl)) < 3:
+            return None
+
+        coefficients = np.polyfit(cl, cd, 2)
+        tolerance = 1.0e-10 * np.max(np.abs(cd))
+        if np.max(np.abs(np.polyval(coefficients, cl) - cd)) > tolerance:
+            return None
+
+        return coefficients
@@ -164,8 +164,6 @@ class RangedRoute(FlightSequence):
         """
         self.cruise_distance = cruise_distance
         self._flight_points = super().compute_from(start)
-        obtained_distance = (
-            self._flight_points.iloc[-1].ground_distance
-            - self._flight_points.iloc[0].ground_distance
-        )
+        ground_distances = self._flight_points["ground_distance"].to_numpy()
+        obtained_distance = ground_distances[-1] - ground_distances[0]
         return self.flight_distance - obtained_distance
@@ -30,6 +30,13 @@ from ..segments.registered.altitude_change import AltitudeChangeSegment
 from ..segments.registered.speed_change import SpeedChangeSegment
 from ..segments.registered.taxi import TaxiSegment
 
+# Altitude and speed thresholds of the flight phases defined below, in SI units.
+ALTITUDE_400_FT = 400.0 * foot
+ALTITUDE_1500_FT = 1500.0 * foot
+ALTITUDE_10000_FT = 10000.0 * foot
+EAS_250_KT = 250.0 * knot
+EAS_300_KT = 300.0 * knot
+
 
 @pytest.fixture(scope="module")
 def propulsion():
@@ -38,7 +45,7 @@ def propulsion():
     return FuelEngineSet(DummyEngine(1.0e5, 1.0e-4), 2)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def high_speed_polar() -> Polar:
     """Returns a dummy polar where max L/D ratio is about 16., around CL=0.5"""
     cl = np.arange(0.0, 1.5, 0.01)
@@ -46,7 +53,7 @@ def high_speed_polar() -> Polar:
     return Polar(cl, cd)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def low_speed_polar() -> Polar:
     """Returns a dummy polar where max L/D ratio is around CL=0.5"""
     cl = np.arange(0.0, 2.0, 0.01)
@@ -207,17 +214,17 @@ class InitialClimbPhase(AbstractManualThrustFlightPhase):
         self.extend(
             [
                 AltitudeChangeSegment(
-                    target=FlightPoint(equivalent_airspeed="constant", altitude=400.0 * foot),
+                    target=FlightPoint(equivalent_airspeed="constant", altitude=ALTITUDE_400_FT),
                     engine_setting=EngineSetting.TAKEOFF,
                     **self.segment_kwargs,
                 ),
                 SpeedChangeSegment(
-                    target=FlightPoint(equivalent_airspeed=250.0 * knot),
+                    target=FlightPoint(equivalent_airspeed=EAS_250_KT),
                     engine_setting=EngineSetting.TAKEOFF,
                     **self.segment_kwargs,
                 ),
                 AltitudeChangeSegment(
-                    target=FlightPoint(equivalent_airspeed="constant", altitude=1500.0 * foot),
+                    target=FlightPoint(equivalent_airspeed="constant", altitude=ALTITUDE_1500_FT),
                     engine_setting=EngineSetting.TAKEOFF,
                     **self.segment_kwargs,
                 ),
@@ -245,11 +252,11 @@ class ClimbPhase(AbstractManualThrustFlightPhase):
         self.extend(
             [
                 AltitudeChangeSegment(
-                    target=FlightPoint(equivalent_airspeed="constant", altitude=10000.0 * foot),
+                    target=FlightPoint(equivalent_airspeed="constant", altitude=ALTITUDE_10000_FT),
                     **self.segment_kwargs,
                 ),
                 SpeedChangeSegment(
-                    target=FlightPoint(equivalent_airspeed=300.0 * knot), **self.segment_kwargs
+                    target=FlightPoint(equivalent_airspeed=EAS_300_KT), **self.segment_kwargs
                 ),
                 AltitudeChangeSegment(
                     target=FlightPoint(equivalent_airspeed="constant", mach=self.maximum_mach),
@@ -283,15 +290,15 @@ class DescentPhase(AbstractManualThrustFlightPhase):
         self.extend(
             [
                 AltitudeChangeSegment(
-                    target=FlightPoint(equivalent_airspeed=300.0 * knot, mach="constant"),
+                    target=FlightPoint(equivalent_airspeed=EAS_300_KT, mach="constant"),
                     **self.segment_kwargs,
                 ),
                 AltitudeChangeSegment(
-                    target=FlightPoint(altitude=10000.0 * foot, equivalent_airspeed="constant"),
+                    target=FlightPoint(altitude=ALTITUDE_10000_FT, equivalent_airspeed="constant"),
                     **self.segment_kwargs,
                 ),
                 SpeedChangeSegment(
-                    target=FlightPoint(equivalent_airspeed=250.0 * knot), **self.segment_kwargs
+                    target=FlightPoint(equivalent_airspeed=EAS_250_KT), **self.segment_kwargs
                 ),
                 AltitudeChangeSegment(
                     target=FlightPoint(
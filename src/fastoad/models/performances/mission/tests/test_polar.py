@@ -0,0 +1,52 @@
+"""Tests module for polar.py"""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+from numpy.testing import assert_allclose
+from scipy.interpolate import interp1d
+
+from ..polar import Polar
+
+
+def test_polar_cd():
+    cl_values = [0.2, 0.65, 1.3, 1.8]
+    cl = np.arange(0.0, 1.5, 0.01)
+
+    # Quadratic polar
+    cd = 0.6e-1 * cl**2 + 0.016
+    polar = Polar(cl, cd)
+    assert_allclose(polar.cd(cl_values), 0.6e-1 * np.asarray(cl_values) ** 2 + 0.016)
+    assert_allclose(
+        polar.cd(cl_values),
+        interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")(cl_values),
+    )
+    assert_allclose(polar.cd(), cd)
+    assert_allclose(polar.optimal_cl, np.sqrt(0.016 / 0.6e-1), rtol=1e-3)
+
+    # Non-quadratic polar: results should be the same as with interp1d
+    cd = 0.6e-1 * cl**2 + 0.02 * cl**4 + 0.016
+    polar = Polar(cl, cd)
+    assert_allclose(
+        polar.cd(cl_values),
+        interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")(cl_values),
+    )
+    assert_allclose(polar.cd(), cd)
+
+    # Non-quadratic polar with small CD values
+    cd = 1.0e-6 * (0.6e-1 * cl**2 + 0.02 * cl**4 + 0.016)
+    polar = Polar(cl, cd)
+    assert_allclose(
+        polar.cd(cl_values),
+        interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")(cl_values),
+    )
@@ -21,7 +21,7 @@ from scipy.constants import foot, knot
 
 from fastoad.constants import EngineSetting, FlightPhase
 from fastoad.model_base import FlightPoint
-from .conftest import ClimbPhase, DescentPhase, InitialClimbPhase
+from .conftest import ALTITUDE_1500_FT, ClimbPhase, DescentPhase, InitialClimbPhase
 from ..routes import RangedRoute
 from ..segments.registered.cruise import CruiseSegment
 
@@ -60,7 +60,7 @@ def test_ranged_route(low_speed_polar, high_speed_polar, propulsion, cleanup):
         **kwargs,
         polar=high_speed_polar,
         thrust_rate=0.05,
-        target_altitude=1500.0 * foot,
+        target_altitude=ALTITUDE_1500_FT,
         name=FlightPhase.DESCENT.value,
         time_step=5.0,
     )
@@ -181,35 +181,40 @@ class ValidityDomainChecker:
         """
         records: List[CheckRecord] = []
 
+        # Limit definitions are indexed by variable name beforehand, so that each variable
+        # is not tested against all registered checkers.
+        limit_definitions_by_name: Dict[str, List[_LimitDefinitions]] = {}
+        for limit_definitions in cls._limit_definitions.values():
+            if limit_definitions.activated or not activated_only:
+                for var_name in limit_definitions:
+                    limit_definitions_by_name.setdefault(var_name, []).append(limit_definitions)
+
         for var in variables:
-            for limit_definitions in cls._limit_definitions.values():
-                if (
-                    limit_definitions.activated or not activated_only
-                ) and var.name in limit_definitions:
-                    limit_def = limit_definitions[var.name]
-                    value = convert_units(var.value, var.units, limit_def.units)
-                    if np.any(value < limit_def.lower):
-                        status = ValidityStatus.TOO_LOW
-                        limit = limit_def.lower
-                    elif np.any(value > limit_def.upper):
-                        status = ValidityStatus.TOO_HIGH
-                        limit = limit_def.upper
-                    else:
-                        status = ValidityStatus.OK
-                        limit = None
-
-                    records.append(
-                        CheckRecord(
-                            var.name,
-                            status,
-                            limit,
-                            limit_def.units,
-                            var.value,
-                            var.units,
-                            limit_definitions.source_file,
-                            limit_definitions.logger_name,
-                        )
+            for limit_definitions in limit_definitions_by_name.get(var.name, []):
+                limit_def = limit_definitions[var.name]
+                value = convert_units(var.value, var.units, limit_def.units)
+                if np.any(value < limit_def.lower):
+                    status = ValidityStatus.TOO_LOW
+                    limit = limit_def.lower
+                elif np.any(value > limit_def.upper):
+                    status = ValidityStatus.TOO_HIGH
+                    limit = limit_def.upper
+                else:
+                    status = ValidityStatus.OK
+                    limit = None
+
+                records.append(
+                    CheckRecord(
+                        var.name,
+                        status,
+                        limit,
+                        limit_def.units,
+                        var.value,
+                        var.units,
+                        limit_definitions.source_file,
+                        limit_definitions.logger_name,
                     )
+                )
         return records
 
     @staticmethod
@@ -254,12 +259,16 @@ class ValidityDomainChecker:
             problem, get_promoted_names=False, promoted_only=False
         )
 
+        # Many variables belong to the same system, so systems are retrieved only once.
+        systems = {"": problem.model}
         for var in variables:
-            system_path = var.name.split(".")
-            system = problem.model
-            for system_name in system_path[:-1]:
-                system = getattr(system, system_name)
-            var_name = system_path[-1]
+            system_path, _, var_name = var.name.rpartition(".")
+            system = systems.get(system_path)
+            if system is None:
+                system = problem.model
+                for system_name in system_path.split("."):
+                    system = getattr(system, system_name)
+                systems[system_path] = system
 
             if hasattr(system, "_fastoad_limit_definitions"):
                 limit_definitions = system._fastoad_limit_definitions
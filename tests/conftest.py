@@ -11,4 +11,28 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import pytest
+
 from src.conftest import no_xfoil_skip, xfoil_path  # noqa: F401
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--emit-diagrams",
+        action="store_true",
+        default=False,
+        help="Write OpenMDAO connection viewer and N2 diagram of problems in integration tests.",
+    )
+
+
+@pytest.fixture
+def emit_diagrams(request) -> bool:
+    """True if OpenMDAO diagrams should be written (see option --emit-diagrams)."""
+    return request.config.getoption("--emit-diagrams")
+
+
+@pytest.fixture
+def print_results(request) -> bool:
+    """True if detailed test results should be printed (pytest run with -vv or more)."""
+    # Project configuration already adds --verbose once.
+    return request.config.getoption("verbose") > 1
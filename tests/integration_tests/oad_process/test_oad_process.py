@@ -42,7 +42,7 @@ def cleanup():
     rmtree(RESULTS_FOLDER_PATH, ignore_errors=True)
 
 
-def test_oad_process(cleanup):
+def test_oad_process(cleanup, emit_diagrams):
     """
     Test for the overall aircraft design process.
     """
@@ -59,33 +59,38 @@ def test_oad_process(cleanup):
     problem.run_model()
     problem.write_outputs()
 
-    if not pth.exists(RESULTS_FOLDER_PATH):
-        os.mkdir(RESULTS_FOLDER_PATH)
-    om.view_connections(
-        problem, outfile=pth.join(RESULTS_FOLDER_PATH, "connections.html"), show_browser=False
-    )
-    om.n2(problem, outfile=pth.join(RESULTS_FOLDER_PATH, "n2.html"), show_browser=False)
+    if emit_diagrams:
+        if not pth.exists(RESULTS_FOLDER_PATH):
+            os.mkdir(RESULTS_FOLDER_PATH)
+        om.view_connections(
+            problem, outfile=pth.join(RESULTS_FOLDER_PATH, "connections.html"), show_browser=False
+        )
+        om.n2(problem, outfile=pth.join(RESULTS_FOLDER_PATH, "n2.html"), show_browser=False)
 
     # Check that weight-performances loop correctly converged
     _check_weight_performance_loop(problem)
 
 
-def test_non_regression_breguet(cleanup, xfoil_path):
+def test_non_regression_breguet(cleanup, xfoil_path, emit_diagrams, print_results):
     run_non_regression_test(
         "oad_process_breguet.yml",
         "CeRAS01_legacy_breguet_result.xml",
         "non_regression_breguet",
         use_xfoil=True,
         xfoil_path=xfoil_path,
+        emit_diagrams=emit_diagrams,
+        print_results=print_results,
     )
 
 
-def test_non_regression_mission_only(cleanup):
+def test_non_regression_mission_only(cleanup, emit_diagrams, print_results):
     run_non_regression_test(
         "oad_process_mission_only.yml",
         "CeRAS01_legacy_mission_only_result.xml",
         "non_regression_mission_only",
         use_xfoil=False,
+        emit_diagrams=emit_diagrams,
+        print_results=print_results,
         vars_to_check=["data:mission:sizing:needed_block_fuel"],
         specific_tolerance=1.0e-2,
         global_tolerance=10.0e-2,
@@ -120,6 +125,8 @@ def run_non_regression_test(
     vars_to_check=None,
     specific_tolerance=5.0e-3,
     check_weight_perfo_loop=True,
+    emit_diagrams=False,
+    print_results=False,
 ):
     """
     Convenience function for non regression tests
@@ -134,6 +141,9 @@ def run_non_regression_test(
     :param global_tolerance: test will fail if absolute relative error between computed and
                              reference values is beyond this value for ANY variable
     :param check_weight_perfo_loop: if True, consistency of weights will be checked
+    :param emit_diagrams: if True, OpenMDAO connection viewer will be written in result folder
+    :param print_results: if True, computed and reference values will be printed, sorted by
+                          relative difference
     """
     results_folder_path = pth.join(RESULTS_FOLDER_PATH, result_dir)
     configuration_file_path = pth.join(results_folder_path, conf_file)
@@ -154,43 +164,77 @@ def run_non_regression_test(
 
     # Run model ---------------------------------------------------------------
     problem.run_model()
-    problem.write_outputs()
-
-    om.view_connections(
-        problem, outfile=pth.join(results_folder_path, "connections.html"), show_browser=False
-    )
+    # Written variables have been read once from problem. Reusing them avoids calling
+    # problem.get_val() again for each reference variable.
+    output_variables = problem.write_outputs()
+    if output_variables is None:
+        # No output file has been configured
+        output_variables = oad.VariableList.from_problem(problem)
+    problem_variables = {var.name: var for var in output_variables}
+    for var in problem.additional_variables or []:
+        problem_variables.pop(var.name, None)
+
+    if emit_diagrams:
+        om.view_connections(
+            problem, outfile=pth.join(results_folder_path, "connections.html"), show_browser=False
+        )
 
     if check_weight_perfo_loop:
         _check_weight_performance_loop(problem)
 
     ref_data = oad.DataFile(pth.join(DATA_FOLDER_PATH, legacy_result_file))
 
-    row_list = []
+    names = []
+    units = []
+    ref_values = []
+    values = []
     for ref_var in ref_data:
         try:
+            var = problem_variables[ref_var.name]
             ref_value = np.asarray(ref_var.value).item()
-            value = problem.get_val(ref_var.name, units=ref_var.units).item()
+            if var.units == ref_var.units:
+                value = np.asarray(var.value).item()
+            else:
+                value = np.asarray(var.get_val(ref_var.units)).item()
         except (KeyError, ValueError):
             continue
-        row_list.append(
-            {
-                "name": ref_var.name,
-                "units": ref_var.units,
-                "ref_value": ref_value,
-                "value": value,
-            }
+        names.append(ref_var.name)
+        units.append(ref_var.units)
+        ref_values.append(ref_value)
+        values.append(value)
+
+    ref_values = np.array(ref_values, dtype=float)
+    values = np.array(values, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rel_delta = np.where(
+            (ref_values == 0.0) & (np.abs(values) <= 1e-10),
+            0.0,
+            (values - ref_values) / ref_values,
         )
 
-    df = pd.DataFrame(row_list)
-    df["rel_delta"] = (df.value - df.ref_value) / df.ref_value
-    df["rel_delta"][(df.ref_value == 0) & (abs(df.value) <= 1e-10)] = 0.0
-    df["abs_rel_delta"] = np.abs(df.rel_delta)
+    df = pd.DataFrame(
+        {
+            "name": names,
+            "units": units,
+            "ref_value": ref_values,
+            "value": values,
+            "rel_delta": rel_delta,
+            "abs_rel_delta": np.abs(rel_delta),
+        }
+    )
 
-    pd.set_option("display.max_rows", None)
-    pd.set_option("display.max_columns", None)
-    pd.set_option("display.width", 1000)
-    pd.set_option("display.max_colwidth", 120)
-    print(df.sort_values(by=["abs_rel_delta"]))
+    if print_results:
+        with pd.option_context(
+            "display.max_rows",
+            None,
+            "display.max_columns",
+            None,
+            "display.width",
+            1000,
+            "display.max_colwidth",
+            120,
+        ):
+            print(df.sort_values(by=["abs_rel_delta"]))
 
     assert_allclose(df.value, df.ref_value, rtol=global_tolerance, atol=1.0e-9)
     if vars_to_check is not None:
@@ -199,8 +243,17 @@ def run_non_regression_test(
             assert_allclose(row.value, row.ref_value, rtol=specific_tolerance, atol=1.0e-9)
 
 
-def test_api_eval_breguet(cleanup):
-    results_folder_path = pth.join(RESULTS_FOLDER_PATH, "api_eval_breguet")
+@pytest.fixture(scope="module")
+def api_configuration_file_path(cleanup) -> str:
+    """
+    Generates, once for all API tests, the configuration file and the matching input file.
+
+    Tests should not use these files directly, but copies from :func:`_copy_api_configuration`,
+    so that each test has its own output file.
+
+    :return: path of the configuration file
+    """
+    results_folder_path = pth.join(RESULTS_FOLDER_PATH, "api")
     configuration_file_path = pth.join(results_folder_path, "oad_process.yml")
 
     # Generation of configuration file ----------------------------------------
@@ -211,6 +264,27 @@ def test_api_eval_breguet(cleanup):
     source_xml = pth.join(DATA_FOLDER_PATH, "CeRAS01_notebooks.xml")
     oad.generate_inputs(configuration_file_path, source_xml, overwrite=True)
 
+    return configuration_file_path
+
+
+def _copy_api_configuration(configuration_file_path: str, result_dir: str) -> str:
+    """
+    Copies the generated configuration and input files in a folder dedicated to one test.
+
+    :param configuration_file_path: path of the generated configuration file
+    :param result_dir: relative name, folder will be in RESULTS_FOLDER_PATH
+    :return: path of the copied configuration file
+    """
+    results_folder_path = pth.join(RESULTS_FOLDER_PATH, result_dir)
+    shutil.copytree(pth.dirname(configuration_file_path), results_folder_path, dirs_exist_ok=True)
+    return pth.join(results_folder_path, pth.basename(configuration_file_path))
+
+
+def test_api_eval_breguet(api_configuration_file_path):
+    configuration_file_path = _copy_api_configuration(
+        api_configuration_file_path, "api_eval_breguet"
+    )
+
     # Run model ---------------------------------------------------------------
     problem = oad.evaluate_problem(configuration_file_path, True)
 
@@ -228,17 +302,8 @@ def test_api_eval_breguet(cleanup):
     _run_plots(problem.output_file_path)
 
 
-def test_api_optim(cleanup):
-    results_folder_path = pth.join(RESULTS_FOLDER_PATH, "api_optim")
-    configuration_file_path = pth.join(results_folder_path, "oad_process.yml")
-
-    # Generation of configuration file ----------------------------------------
-    oad.generate_configuration_file(configuration_file_path, True)
-
-    # Generation of inputs ----------------------------------------------------
-    # We get the same inputs as in tutorial notebook
-    source_xml = pth.join(DATA_FOLDER_PATH, "CeRAS01_notebooks.xml")
-    oad.generate_inputs(configuration_file_path, source_xml, overwrite=True)
+def test_api_optim(api_configuration_file_path):
+    configuration_file_path = _copy_api_configuration(api_configuration_file_path, "api_optim")
 
     # Run optim ---------------------------------------------------------------
     problem = oad.optimize_problem(configuration_file_path, True)
@@ -258,25 +323,25 @@ def test_api_optim(cleanup):
 
 
 def _check_weight_performance_loop(problem):
+    # All mass balances are checked at once, and each variable is read only once.
+    owe = problem["data:weight:aircraft:OWE"]
     assert_allclose(
-        problem["data:weight:aircraft:OWE"],
-        problem["data:weight:airframe:mass"]
-        + problem["data:weight:propulsion:mass"]
-        + problem["data:weight:systems:mass"]
-        + problem["data:weight:furniture:mass"]
-        + problem["data:weight:crew:mass"],
-        atol=1,
-    )
-    assert_allclose(
-        problem["data:weight:aircraft:MZFW"],
-        problem["data:weight:aircraft:OWE"] + problem["data:weight:aircraft:max_payload"],
-        atol=1,
-    )
-    assert_allclose(
-        problem["data:weight:aircraft:MTOW"],
-        problem["data:weight:aircraft:OWE"]
-        + problem["data:weight:aircraft:payload"]
-        + problem["data:weight:aircraft:sizing_onboard_fuel_at_input_weight"],
+        np.concatenate(
+            [owe, problem["data:weight:aircraft:MZFW"], problem["data:weight:aircraft:MTOW"]]
+        ),
+        np.concatenate(
+            [
+                problem["data:weight:airframe:mass"]
+                + problem["data:weight:propulsion:mass"]
+                + problem["data:weight:systems:mass"]
+                + problem["data:weight:furniture:mass"]
+                + problem["data:weight:crew:mass"],
+                owe + problem["data:weight:aircraft:max_payload"],
+                owe
+                + problem["data:weight:aircraft:payload"]
+                + problem["data:weight:aircraft:sizing_onboard_fuel_at_input_weight"],
+            ]
+        ),
         atol=1,
     )
 